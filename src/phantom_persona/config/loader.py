@@ -5,6 +5,7 @@ including YAML files, JSON files, and dictionaries.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Union
 
@@ -14,6 +15,19 @@ from pydantic import ValidationError
 from phantom_persona.config.schema import PhantomConfig
 from phantom_persona.core.exceptions import ConfigNotFoundError, ConfigValidationError
 
+# Prefer the libyaml-backed C loader, falling back to the pure-Python one
+# when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+# orjson is optional; the stdlib parser is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class ConfigLoader:
     """Configuration loader for phantom-persona.
@@ -37,7 +51,8 @@ class ConfigLoader:
         """Load configuration from various sources.
 
         Automatically detects the source type and loads configuration:
-        - str/Path: Loads from file (YAML or JSON based on extension)
+        - str/Path: Loads from file (JSON or YAML based on extension);
+          JSON is the faster format to parse for configs loaded repeatedly
         - dict: Uses the dictionary directly
 
         Args:
@@ -56,30 +71,76 @@ class ConfigLoader:
         """
         # Handle dictionary input
         if isinstance(source, dict):
-            config_dict = source
+            return ConfigLoader._validate(source)
+
+        # Convert to Path
+        path = Path(source)
+
+        # Check if file exists
+        if not path.exists():
+            raise ConfigNotFoundError(
+                f"Configuration file not found: {path}",
+                details={"path": str(path)},
+            )
+
+        # Parsed files are cached by (path, mtime, size), so an edited file is
+        # re-read; callers get a deep copy they are free to modify
+        stat = path.stat()
+        config = _load_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        return config.model_copy(deep=True)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached file configurations.
+
+        Files are re-read automatically when their mtime or size changes;
+        this is only needed to force a reload of an unchanged file.
+
+        Example:
+            >>> ConfigLoader.invalidate_cache()
+        """
+        _load_file_cached.cache_clear()
+
+    @staticmethod
+    def _load_file(path: Path) -> PhantomConfig:
+        """Read, parse and validate a configuration file.
+
+        Args:
+            path: Path to YAML or JSON file
+
+        Returns:
+            Validated PhantomConfig instance
+
+        Raises:
+            ConfigValidationError: If the format is unsupported or invalid
+        """
+        # Determine file type by extension (JSON first: cheapest to parse)
+        suffix = path.suffix.lower()
+        if suffix == ".json":
+            config_dict = ConfigLoader.load_json(path)
+        elif suffix in (".yaml", ".yml"):
+            config_dict = ConfigLoader.load_yaml(path)
         else:
-            # Convert to Path
-            path = Path(source)
-
-            # Check if file exists
-            if not path.exists():
-                raise ConfigNotFoundError(
-                    f"Configuration file not found: {path}",
-                    details={"path": str(path)},
-                )
-
-            # Determine file type by extension
-            suffix = path.suffix.lower()
-            if suffix in (".yaml", ".yml"):
-                config_dict = ConfigLoader.load_yaml(path)
-            elif suffix == ".json":
-                config_dict = ConfigLoader.load_json(path)
-            else:
-                raise ConfigValidationError(
-                    f"Unsupported file format: {suffix}",
-                    details={"path": str(path), "supported": [".yaml", ".yml", ".json"]},
-                )
+            raise ConfigValidationError(
+                f"Unsupported file format: {suffix}",
+                details={"path": str(path), "supported": [".yaml", ".yml", ".json"]},
+            )
+
+        return ConfigLoader._validate(config_dict)
+
+    @staticmethod
+    def _validate(config_dict: Dict[str, Any]) -> PhantomConfig:
+        """Merge configuration with defaults and validate it.
+
+        Args:
+            config_dict: Configuration dictionary
+
+        Returns:
+            Validated PhantomConfig instance
 
+        Raises:
+            ConfigValidationError: If configuration validation fails
+        """
         # Merge with defaults
         config_dict = ConfigLoader.merge_with_defaults(config_dict)
 
@@ -110,7 +171,7 @@ class ConfigLoader:
         """
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
                 return data if data is not None else {}
         except yaml.YAMLError as e:
             raise ConfigValidationError(
@@ -140,9 +201,12 @@ class ConfigLoader:
             >>> config_dict = ConfigLoader.load_json(Path("config.json"))
         """
         try:
+            if orjson is not None:
+                return orjson.loads(path.read_bytes())
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ConfigValidationError(
                 f"Failed to parse JSON file: {path}",
                 details={"path": str(path), "error": str(e)},
@@ -199,6 +263,11 @@ class ConfigLoader:
             >>> config.browser.headless
             True
         """
+        # Known-good levels skip validation: model_construct still fills every
+        # section from its default_factory, so each call gets fresh sub-models
+        if isinstance(level, int) and not isinstance(level, bool) and 0 <= level <= 4:
+            return PhantomConfig.model_construct(level=int(level))
+
         try:
             return PhantomConfig(level=level)
         except ValidationError as e:
@@ -208,4 +277,21 @@ class ConfigLoader:
             ) from e
 
 
+@lru_cache(maxsize=32)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> PhantomConfig:
+    """Load a configuration file, memoized by path, mtime and size.
+
+    The mtime and size arguments are only part of the cache key.
+
+    Args:
+        path: Resolved path to the configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Validated PhantomConfig instance (shared, must not be modified)
+    """
+    return ConfigLoader._load_file(Path(path))
+
+
 __all__ = ["ConfigLoader"]
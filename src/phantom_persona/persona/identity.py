@@ -6,13 +6,34 @@ including geographical information, device characteristics, and fingerprints.
 
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 from uuid import uuid4
 
 if TYPE_CHECKING:
     from phantom_persona.proxy.models import ProxyInfo
 
 
+def _generate_id() -> str:
+    """Generate a new unique persona identifier.
+
+    Returns:
+        UUID4 string in canonical (dashed) form
+    """
+    return str(uuid4())
+
+
+def _parse_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO format string, passing datetime objects through.
+
+    Args:
+        value: ISO format datetime string or datetime instance
+
+    Returns:
+        datetime instance
+    """
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
 @dataclass
 class GeoInfo:
     """Geographical and locale information for a persona.
@@ -153,7 +174,7 @@ class Persona:
     fingerprint: Fingerprint
     geo: GeoInfo
     created_at: datetime
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_generate_id)
     proxy: Optional["ProxyInfo"] = None
     cookies: Dict[str, Any] = field(default_factory=dict)
     local_storage: Dict[str, Any] = field(default_factory=dict)
@@ -161,13 +182,16 @@ class Persona:
     use_count: int = 0
     is_burned: bool = False
 
-    def mark_used(self) -> None:
+    def mark_used(self, now: Optional[datetime] = None) -> None:
         """Mark the persona as used and update usage statistics.
 
         Updates the last_used timestamp to now and increments the use_count.
         This helps track persona usage patterns and detect if a persona
         is being overused.
 
+        Args:
+            now: Optional usage timestamp (default: datetime.now())
+
         Example:
             >>> persona = Persona(...)
             >>> persona.mark_used()
@@ -176,7 +200,7 @@ class Persona:
             >>> persona.last_used
             datetime.datetime(2024, 1, 1, 12, 0, 0)
         """
-        self.last_used = datetime.now()
+        self.last_used = now if now is not None else datetime.now()
         self.use_count += 1
 
     def burn(self) -> None:
@@ -238,33 +262,24 @@ class Persona:
             ... }
             >>> persona = Persona.from_dict(data)
         """
-        # Create nested dataclasses
+        # Create nested dataclasses without mutating the input dict
         fingerprint_data = data["fingerprint"]
-        device_data = fingerprint_data["device"]
-
-        device = DeviceInfo(**device_data)
-        fingerprint_data["device"] = device
-        fingerprint = Fingerprint(**fingerprint_data)
-
+        fingerprint = Fingerprint(
+            **{**fingerprint_data, "device": DeviceInfo(**fingerprint_data["device"])}
+        )
         geo = GeoInfo(**data["geo"])
 
         # Parse datetime strings
-        created_at = (
-            datetime.fromisoformat(data["created_at"])
-            if isinstance(data["created_at"], str)
-            else data["created_at"]
-        )
-        last_used = None
-        if data.get("last_used"):
-            last_used = (
-                datetime.fromisoformat(data["last_used"])
-                if isinstance(data["last_used"], str)
-                else data["last_used"]
-            )
+        created_at = _parse_datetime(data["created_at"])
+        last_used = data.get("last_used")
+        last_used = _parse_datetime(last_used) if last_used else None
+
+        # Only generate a new ID when the stored data doesn't carry one
+        persona_id = data.get("id") or _generate_id()
 
         # Create persona with all fields
         return cls(
-            id=data.get("id", str(uuid4())),
+            id=persona_id,
             fingerprint=fingerprint,
             geo=geo,
             proxy=data.get("proxy"),
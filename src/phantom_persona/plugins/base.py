@@ -6,7 +6,7 @@ add human-like behavior to browser sessions.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar, FrozenSet, Optional
 
 if TYPE_CHECKING:
     from playwright.async_api import BrowserContext, Page
@@ -19,9 +19,15 @@ class Plugin(ABC):
     to browser contexts and pages. Each plugin has a unique name,
     priority for execution order, and can be browser-specific.
 
+    Plugins carry no per-instance state: ``name`` and ``priority`` are
+    class-level settings, and the base classes declare empty ``__slots__``
+    so subclasses that do the same get instances without a ``__dict__``.
+
     Attributes:
         name: Unique plugin identifier (e.g., "stealth.basic", "fingerprint.canvas")
         priority: Execution order (lower values execute first, default: 100)
+        compatible_browsers: Browser types the plugin supports
+            (None means all browsers, default: None)
 
     Example:
         >>> class MyPlugin(Plugin):
@@ -33,8 +39,11 @@ class Plugin(ABC):
         ...         pass
     """
 
-    name: str
-    priority: int = 100
+    __slots__ = ()
+
+    name: ClassVar[str]
+    priority: ClassVar[int] = 100
+    compatible_browsers: ClassVar[Optional[FrozenSet[str]]] = None
 
     @abstractmethod
     async def apply(self, context: "BrowserContext") -> None:
@@ -73,8 +82,11 @@ class Plugin(ABC):
     def is_compatible(self, browser_type: str) -> bool:
         """Check if plugin is compatible with browser type.
 
-        Override this to restrict plugin to specific browser types.
-        By default, plugins are compatible with all browsers.
+        Checks ``compatible_browsers``; by default, plugins are compatible
+        with all browsers. Prefer setting ``compatible_browsers`` to restrict
+        a plugin, since the registry can then skip incompatible plugins
+        without instantiating them. Override this only when compatibility
+        depends on more than the browser type.
 
         Args:
             browser_type: Browser type ("chromium", "firefox", or "webkit")
@@ -83,11 +95,13 @@ class Plugin(ABC):
             True if plugin is compatible, False otherwise
 
         Example:
-            >>> def is_compatible(self, browser_type):
-            ...     # Only works with Chromium
-            ...     return browser_type == "chromium"
+            >>> class ChromeOnlyPlugin(StealthPlugin):
+            ...     name = "stealth.chrome"
+            ...     compatible_browsers = frozenset({"chromium"})
+            >>> ChromeOnlyPlugin().is_compatible("firefox")
+            False
         """
-        return True
+        return self.compatible_browsers is None or browser_type in self.compatible_browsers
 
     def __repr__(self) -> str:
         """String representation of the plugin.
@@ -114,11 +128,11 @@ class Plugin(ABC):
             True if this plugin has lower priority (should run first)
 
         Example:
-            >>> plugin1 = MyPlugin()
-            >>> plugin1.priority = 50
-            >>> plugin2 = MyPlugin()
-            >>> plugin2.priority = 100
-            >>> plugin1 < plugin2
+            >>> class EarlyPlugin(MyPlugin):
+            ...     priority = 50
+            >>> class LatePlugin(MyPlugin):
+            ...     priority = 100
+            >>> EarlyPlugin() < LatePlugin()
             True
         """
         return self.priority < other.priority
@@ -149,7 +163,7 @@ class StealthPlugin(Plugin):
         ...         ''')
     """
 
-    pass
+    __slots__ = ()
 
 
 class FingerprintPlugin(Plugin):
@@ -178,7 +192,7 @@ class FingerprintPlugin(Plugin):
         ...         ''')
     """
 
-    pass
+    __slots__ = ()
 
 
 class BehaviorPlugin(Plugin):
@@ -211,7 +225,7 @@ class BehaviorPlugin(Plugin):
         ...         await asyncio.sleep(random.uniform(delays["min"], delays["max"]))
     """
 
-    pass
+    __slots__ = ()
 
 
 __all__ = [
@@ -112,8 +112,9 @@ class PluginRegistry:
         """Get instantiated plugins for a protection level.
 
         Retrieves all plugins defined for the given protection level,
-        instantiates them, filters by browser compatibility, and sorts
-        by priority.
+        filters by browser compatibility, instantiates them, and sorts
+        by priority. Plugins whose ``compatible_browsers`` excludes
+        ``browser_type`` are never instantiated.
 
         Args:
             level: Protection level (ProtectionLevel enum or int 0-4)
@@ -138,18 +139,23 @@ class PluginRegistry:
         plugins: List["Plugin"] = []
 
         for name in plugin_names:
-            try:
-                plugin_class = self.get(name)
-                plugin = plugin_class()
-
-                # Only include if compatible with browser
-                if plugin.is_compatible(browser_type):
-                    plugins.append(plugin)
-            except KeyError:
+            plugin_class = self._plugins.get(name)
+            if plugin_class is None:
                 # Plugin not registered yet, skip it
                 # This can happen during initial setup or if a plugin module
                 # hasn't been imported yet
-                pass
+                continue
+
+            # Skip plugins restricted to other browsers without instantiating them
+            compatible = plugin_class.compatible_browsers
+            if compatible is not None and browser_type not in compatible:
+                continue
+
+            plugin = plugin_class()
+
+            # Only include if compatible with browser
+            if plugin.is_compatible(browser_type):
+                plugins.append(plugin)
 
         # Sort by priority (lower values first)
         return sorted(plugins, key=lambda p: p.priority)
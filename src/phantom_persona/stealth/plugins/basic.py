@@ -12,6 +12,140 @@ if TYPE_CHECKING:
     from playwright.async_api import BrowserContext
 
 
+# JavaScript patches are constant, so they're built once at import time
+# rather than on every apply() call.
+
+_WEBDRIVER_PATCH = """
+// Patch navigator.webdriver
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+    configurable: true
+});
+
+// Also patch in prototype
+delete Object.getPrototypeOf(navigator).webdriver;
+"""
+
+_PLUGINS_PATCH = """
+// Mock navigator.plugins with realistic Chrome plugins
+const plugins = [
+    {
+        0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+        description: "Portable Document Format",
+        filename: "internal-pdf-viewer",
+        length: 1,
+        name: "Chrome PDF Plugin"
+    },
+    {
+        0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+        description: "Portable Document Format",
+        filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+        length: 1,
+        name: "Chrome PDF Viewer"
+    },
+    {
+        0: {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
+        1: {type: "application/x-pnacl", suffixes: "", description: "Portable Native Client Executable"},
+        description: "",
+        filename: "internal-nacl-plugin",
+        length: 2,
+        name: "Native Client"
+    }
+];
+
+Object.defineProperty(navigator, 'plugins', {
+    get: () => plugins,
+    configurable: true
+});
+
+// Mock navigator.mimeTypes to match plugins
+const mimeTypes = [
+    {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+    {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+    {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
+    {type: "application/x-pnacl", suffixes: "", description: "Portable Native Client Executable"}
+];
+
+Object.defineProperty(navigator, 'mimeTypes', {
+    get: () => mimeTypes,
+    configurable: true
+});
+"""
+
+_LANGUAGES_PATCH = """
+// Set navigator.languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+    configurable: true
+});
+
+Object.defineProperty(navigator, 'language', {
+    get: () => 'en-US',
+    configurable: true
+});
+"""
+
+_CHROME_PATCH = """
+// Add window.chrome object
+if (!window.chrome) {
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+}
+
+// Mock chrome.runtime
+if (window.chrome && !window.chrome.runtime) {
+    Object.defineProperty(window.chrome, 'runtime', {
+        value: {},
+        writable: true,
+        enumerable: true,
+        configurable: true
+    });
+}
+"""
+
+_PERMISSIONS_PATCH = """
+// Patch Permissions.query
+const originalQuery = navigator.permissions.query;
+
+navigator.permissions.query = (parameters) => {
+    // For notifications, return denied to avoid permission prompts
+    if (parameters.name === 'notifications') {
+        return Promise.resolve({
+            state: 'denied',
+            onchange: null
+        });
+    }
+
+    // For other permissions, use original behavior
+    return originalQuery(parameters);
+};
+
+// Make the patch undetectable
+Object.defineProperty(navigator.permissions.query, 'toString', {
+    value: () => 'function query() { [native code] }',
+    configurable: true
+});
+"""
+
+# All patches fused into a single init script so applying the plugin costs one
+# round-trip to the browser. Each patch runs in its own block so a patch that
+# throws (e.g. navigator.permissions missing) doesn't prevent the others.
+_ALL_PATCHES = "\n".join(
+    f"try {{{patch}}} catch (e) {{}}"
+    for patch in (
+        _WEBDRIVER_PATCH,
+        _PLUGINS_PATCH,
+        _LANGUAGES_PATCH,
+        _CHROME_PATCH,
+        _PERMISSIONS_PATCH,
+    )
+)
+
+
 @register_plugin
 class BasicStealthPlugin(StealthPlugin):
     """Basic stealth techniques to hide automation.
@@ -24,13 +158,17 @@ class BasicStealthPlugin(StealthPlugin):
     - Patches Permissions.query API
 
     This plugin is suitable for bypassing simple bot detection
-    and is included in protection Level 1 and above.
+    and is included in protection Level 1 and above. It is primarily
+    designed for Chromium, but its patches are generic, so it leaves
+    compatible_browsers unset and runs on all browsers.
 
     Example:
         >>> plugin = BasicStealthPlugin()
         >>> await plugin.apply(context)
     """
 
+    __slots__ = ()
+
     name = "stealth.basic"
     priority = 10  # Apply early
 
@@ -38,17 +176,13 @@ class BasicStealthPlugin(StealthPlugin):
         """Apply basic stealth techniques to browser context.
 
         Injects JavaScript code before page load to hide automation
-        indicators and make the browser appear more human-like.
+        indicators and make the browser appear more human-like. All
+        patches are registered as a single init script.
 
         Args:
             context: Playwright browser context
         """
-        # Apply all stealth patches
-        await context.add_init_script(self._get_webdriver_patch())
-        await context.add_init_script(self._get_plugins_patch())
-        await context.add_init_script(self._get_languages_patch())
-        await context.add_init_script(self._get_chrome_patch())
-        await context.add_init_script(self._get_permissions_patch())
+        await context.add_init_script(_ALL_PATCHES)
 
     def _get_webdriver_patch(self) -> str:
         """Get JavaScript code to hide navigator.webdriver.
@@ -56,16 +190,7 @@ class BasicStealthPlugin(StealthPlugin):
         Returns:
             JavaScript code to patch webdriver property
         """
-        return """
-        // Patch navigator.webdriver
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-            configurable: true
-        });
-
-        // Also patch in prototype
-        delete Object.getPrototypeOf(navigator).webdriver;
-        """
+        return _WEBDRIVER_PATCH
 
     def _get_plugins_patch(self) -> str:
         """Get JavaScript code to mock navigator.plugins.
@@ -75,51 +200,7 @@ class BasicStealthPlugin(StealthPlugin):
         Returns:
             JavaScript code to patch plugins
         """
-        return """
-        // Mock navigator.plugins with realistic Chrome plugins
-        const plugins = [
-            {
-                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                description: "Portable Document Format",
-                filename: "internal-pdf-viewer",
-                length: 1,
-                name: "Chrome PDF Plugin"
-            },
-            {
-                0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-                description: "Portable Document Format",
-                filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                length: 1,
-                name: "Chrome PDF Viewer"
-            },
-            {
-                0: {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
-                1: {type: "application/x-pnacl", suffixes: "", description: "Portable Native Client Executable"},
-                description: "",
-                filename: "internal-nacl-plugin",
-                length: 2,
-                name: "Native Client"
-            }
-        ];
-
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => plugins,
-            configurable: true
-        });
-
-        // Mock navigator.mimeTypes to match plugins
-        const mimeTypes = [
-            {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-            {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-            {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
-            {type: "application/x-pnacl", suffixes: "", description: "Portable Native Client Executable"}
-        ];
-
-        Object.defineProperty(navigator, 'mimeTypes', {
-            get: () => mimeTypes,
-            configurable: true
-        });
-        """
+        return _PLUGINS_PATCH
 
     def _get_languages_patch(self) -> str:
         """Get JavaScript code to set navigator.languages.
@@ -130,18 +211,7 @@ class BasicStealthPlugin(StealthPlugin):
         Returns:
             JavaScript code to patch languages
         """
-        return """
-        // Set navigator.languages
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-            configurable: true
-        });
-
-        Object.defineProperty(navigator, 'language', {
-            get: () => 'en-US',
-            configurable: true
-        });
-        """
+        return _LANGUAGES_PATCH
 
     def _get_chrome_patch(self) -> str:
         """Get JavaScript code to add window.chrome object.
@@ -152,27 +222,7 @@ class BasicStealthPlugin(StealthPlugin):
         Returns:
             JavaScript code to patch window.chrome
         """
-        return """
-        // Add window.chrome object
-        if (!window.chrome) {
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-        }
-
-        // Mock chrome.runtime
-        if (window.chrome && !window.chrome.runtime) {
-            Object.defineProperty(window.chrome, 'runtime', {
-                value: {},
-                writable: true,
-                enumerable: true,
-                configurable: true
-            });
-        }
-        """
+        return _CHROME_PATCH
 
     def _get_permissions_patch(self) -> str:
         """Get JavaScript code to patch Permissions.query.
@@ -183,44 +233,7 @@ class BasicStealthPlugin(StealthPlugin):
         Returns:
             JavaScript code to patch Permissions API
         """
-        return """
-        // Patch Permissions.query
-        const originalQuery = navigator.permissions.query;
-
-        navigator.permissions.query = (parameters) => {
-            // For notifications, return denied to avoid permission prompts
-            if (parameters.name === 'notifications') {
-                return Promise.resolve({
-                    state: 'denied',
-                    onchange: null
-                });
-            }
-
-            // For other permissions, use original behavior
-            return originalQuery(parameters);
-        };
-
-        // Make the patch undetectable
-        Object.defineProperty(navigator.permissions.query, 'toString', {
-            value: () => 'function query() { [native code] }',
-            configurable: true
-        });
-        """
-
-    def is_compatible(self, browser_type: str) -> bool:
-        """Check browser compatibility.
-
-        This plugin is primarily designed for Chromium but has
-        generic patches that work across browsers.
-
-        Args:
-            browser_type: Browser type ("chromium", "firefox", "webkit")
-
-        Returns:
-            True for all browser types
-        """
-        # Works with all browsers, though optimized for Chromium
-        return True
+        return _PERMISSIONS_PATCH
 
 
 __all__ = ["BasicStealthPlugin"]
@@ -1,6 +1,68 @@
 """Pytest configuration for E2E tests."""
 
+from urllib.parse import urlsplit
+
 import pytest
+import pytest_asyncio
+
+from phantom_persona import PhantomPersona, ProtectionLevel
+
+# Detection sites whose documents and scripts are allowed to load
+DETECTION_HOSTS = ("bot.sannysoft.com", "browserleaks.com")
+
+# Resource types the detection checks never need
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet", "websocket"})
+
+# Defines window.__detectionReport() in every document of a context, so tests
+# collect all automation indicators with one short evaluate call instead of
+# shipping and compiling the probe with each evaluate. The function is
+# non-enumerable to stay out of the way of the detection pages themselves.
+DETECTION_REPORT_JS = """
+Object.defineProperty(window, '__detectionReport', {
+    enumerable: false,
+    value: () => ({
+        automation: {
+            webdriver: navigator.webdriver,
+            windowWebdriver: window.navigator.webdriver,
+            hasWebdriver: 'webdriver' in navigator,
+            callPhantom: typeof window.callPhantom,
+            _phantom: typeof window._phantom,
+            nightmare: typeof window.__nightmare,
+            selenium: typeof window._selenium,
+            webdriverFunc: typeof document.documentElement.webdriver,
+            domAutomation: typeof window.domAutomation,
+            domAutomationController: typeof window.domAutomationController
+        },
+        chrome: {
+            hasChrome: typeof window.chrome !== 'undefined',
+            hasRuntime: typeof window.chrome?.runtime !== 'undefined'
+        },
+        navigator: {
+            userAgent: navigator.userAgent,
+            platform: navigator.platform,
+            language: navigator.language,
+            languages: navigator.languages,
+            vendor: navigator.vendor,
+            hardwareConcurrency: navigator.hardwareConcurrency,
+            deviceMemory: navigator.deviceMemory,
+            maxTouchPoints: navigator.maxTouchPoints,
+            hasPermissions: typeof navigator.permissions !== 'undefined',
+            hasPlugins: typeof navigator.plugins !== 'undefined',
+            pluginsLength: navigator.plugins.length
+        },
+        screen: {
+            width: screen.width,
+            height: screen.height,
+            availWidth: screen.availWidth,
+            availHeight: screen.availHeight,
+            colorDepth: screen.colorDepth,
+            pixelDepth: screen.pixelDepth
+        },
+        dateCheck: typeof Date.prototype.getTimezoneOffset,
+        mathCheck: typeof Math.random
+    })
+});
+"""
 
 
 def pytest_configure(config):
@@ -21,3 +83,70 @@ def pytest_collection_modifyitems(config, items):
         # Auto-mark all tests in e2e directory as e2e tests
         if "e2e" in str(item.fspath):
             item.add_marker(pytest.mark.e2e)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def detection_client():
+    """PhantomPersona client shared by all detection tests in the session.
+
+    Starting the client launches the Playwright driver and a browser, which
+    dominates per-test time. Tests open their own session (a fresh context)
+    on the shared client and must run in the session event loop.
+
+    Yields:
+        Started PhantomPersona client with BASIC protection level
+
+    Example:
+        >>> @pytest.mark.asyncio(loop_scope="session")
+        ... async def test_something(detection_client):
+        ...     session = await detection_client.new_session()
+    """
+    async with PhantomPersona(level=ProtectionLevel.BASIC) as client:
+        yield client
+
+
+async def block_noise(route):
+    """Abort requests the detection checks don't need.
+
+    Lets documents and scripts from the detection sites through and aborts
+    everything else (images, fonts, styles, ads, trackers), so pages load
+    quickly and aren't held up by slow third-party hosts.
+
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    first_party = any(host == h or host.endswith("." + h) for h in DETECTION_HOSTS)
+    if first_party and request.resource_type not in BLOCKED_RESOURCE_TYPES:
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def detection_session(detection_client):
+    """Session on the shared client with the detection report installed.
+
+    Shared by all detection tests: they only read navigator/window state,
+    so they can't affect each other. Tests open and close their own pages.
+    Requests not needed by the checks are blocked (see ``block_noise``).
+
+    Yields:
+        Session whose pages expose ``window.__detectionReport()``
+
+    Example:
+        >>> async def test_something(detection_session):
+        ...     page = await detection_session.new_page()
+        ...     try:
+        ...         report = await page.evaluate("window.__detectionReport()")
+        ...     finally:
+        ...         await page.close()
+    """
+    session = await detection_client.new_session()
+    try:
+        await session.context.add_init_script(DETECTION_REPORT_JS)
+        await session.context.route("**/*", block_noise)
+        yield session
+    finally:
+        await session.close()
@@ -0,0 +1,29 @@
+"""Pytest configuration for integration tests."""
+
+import pytest_asyncio
+
+from phantom_persona.config import BrowserConfig
+from phantom_persona.core import BrowserManager
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser():
+    """Chromium browser shared by all integration tests in the session.
+
+    Launching a browser dominates test time, while new contexts are cheap
+    and fully isolated. Tests that only need a context should use this
+    fixture and run in the session event loop:
+
+        @pytest.mark.asyncio(loop_scope="session")
+        async def test_something(shared_browser):
+            context = await shared_browser.browser.new_context()
+
+    Tests that exercise launch options or the manager lifecycle should
+    start their own BrowserManager instead.
+
+    Yields:
+        Started BrowserManager instance
+    """
+    config = BrowserConfig(headless=True)
+    async with BrowserManager(browser_type="chromium", config=config) as manager:
+        yield manager
@@ -9,67 +9,43 @@ from phantom_persona.config import BrowserConfig
 from phantom_persona.core import BrowserManager
 from phantom_persona.core.exceptions import BrowserException, BrowserLaunchError
 
+CUSTOM_UA = "Mozilla/5.0 (Custom User Agent) Test/1.0"
+
 
 # === Browser Manager Tests ===
 
 
 @pytest.mark.asyncio
-async def test_browser_manager_start_close():
-    """Test browser manager start and close lifecycle.
+@pytest.mark.parametrize("browser_type", ["chromium", "firefox", "webkit"])
+async def test_browser_manager_lifecycle(browser_type):
+    """Test browser manager lifecycle with a single browser launch.
 
     Verifies:
-    - Browser can be started
-    - Browser is connected after start
-    - Browser can be closed
-    - Browser is not connected after close
+    - Browser starts automatically on entering the async context manager
+    - Browser type is set correctly
+    - Browser is connected and accessible inside the context
+    - Browser closes automatically on exit
+    - Further close calls are safe (idempotent)
     """
     config = BrowserConfig(headless=True)
-    manager = BrowserManager(browser_type="chromium", config=config)
+    manager = BrowserManager(browser_type=browser_type, config=config)
 
     # Initially not running
     assert not manager.is_running
 
-    # Start browser
-    browser = await manager.start()
-
-    # Check browser is running
-    assert browser is not None
-    assert browser.is_connected()
-    assert manager.is_running
-
-    # Access browser property
-    assert manager.browser == browser
-
-    # Close browser
-    await manager.close()
-
-    # Check browser is stopped
-    assert not manager.is_running
-
-
-@pytest.mark.asyncio
-async def test_browser_manager_context_manager():
-    """Test browser manager as async context manager.
-
-    Verifies:
-    - Browser starts automatically on enter
-    - Browser is available inside context
-    - Browser closes automatically on exit
-    """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
+    async with manager:
         # Browser should be running inside context
         assert manager.is_running
+        assert manager.browser_type == browser_type
         assert manager.browser.is_connected()
 
-        # Can access browser
-        browser = manager.browser
-        assert browser is not None
-
     # Browser should be stopped after exiting context
     assert not manager.is_running
 
+    # Multiple close calls should not raise
+    await manager.close()
+    await manager.close()
+
 
 @pytest.mark.asyncio
 async def test_browser_manager_multiple_browsers():
@@ -95,46 +71,6 @@ async def test_browser_manager_multiple_browsers():
     await manager2.close()
 
 
-@pytest.mark.asyncio
-async def test_browser_manager_firefox():
-    """Test browser manager with Firefox.
-
-    Verifies:
-    - Firefox browser can be launched
-    - Browser type is set correctly
-    """
-    config = BrowserConfig(headless=True)
-    manager = BrowserManager(browser_type="firefox", config=config)
-
-    await manager.start()
-
-    assert manager.is_running
-    assert manager.browser_type == "firefox"
-    assert manager.browser.is_connected()
-
-    await manager.close()
-
-
-@pytest.mark.asyncio
-async def test_browser_manager_webkit():
-    """Test browser manager with WebKit.
-
-    Verifies:
-    - WebKit browser can be launched
-    - Browser type is set correctly
-    """
-    config = BrowserConfig(headless=True)
-    manager = BrowserManager(browser_type="webkit", config=config)
-
-    await manager.start()
-
-    assert manager.is_running
-    assert manager.browser_type == "webkit"
-    assert manager.browser.is_connected()
-
-    await manager.close()
-
-
 @pytest.mark.asyncio
 async def test_browser_manager_invalid_browser_type():
     """Test browser manager with invalid browser type.
@@ -161,221 +97,142 @@ async def test_browser_manager_access_before_start():
         _ = manager.browser
 
 
-@pytest.mark.asyncio
-async def test_browser_manager_close_multiple_times():
-    """Test closing browser multiple times.
-
-    Verifies:
-    - Multiple close calls are safe (idempotent)
-    - No errors are raised
-    """
-    config = BrowserConfig(headless=True)
-    manager = BrowserManager(browser_type="chromium", config=config)
-
-    await manager.start()
-    await manager.close()
-    await manager.close()  # Should not raise error
-    await manager.close()  # Should not raise error
-
-
 # === Browser Context Tests ===
 
 
-@pytest.mark.asyncio
-async def test_browser_creates_context():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_creates_context(shared_browser):
     """Test browser can create new context.
 
     Verifies:
     - Browser context can be created
     - Context is valid and can create pages
     """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-
-        # Create context
-        context = await browser.new_context()
-
-        assert context is not None
-
-        # Create page in context
-        page = await context.new_page()
-        assert page is not None
-
-        # Navigate to a page
-        await page.goto("about:blank")
-        assert page.url == "about:blank"
-
-        await context.close()
-
-
-@pytest.mark.asyncio
-async def test_context_with_viewport():
-    """Test browser context with custom viewport.
+    browser = shared_browser.browser
+
+    # Create context
+    context = await browser.new_context()
+
+    assert context is not None
+
+    # Create page in context
+    page = await context.new_page()
+    assert page is not None
+
+    # New pages start on about:blank
+    assert page.url == "about:blank"
+
+    await context.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "context_kwargs, js_probe, expected",
+    [
+        pytest.param(
+            {"viewport": {"width": 1920, "height": 1080}},
+            "() => ({width: window.innerWidth, height: window.innerHeight})",
+            {"width": 1920, "height": 1080},
+            id="viewport",
+        ),
+        pytest.param(
+            {"user_agent": CUSTOM_UA},
+            "navigator.userAgent",
+            CUSTOM_UA,
+            id="user_agent",
+        ),
+        pytest.param(
+            {"locale": "de-DE", "timezone_id": "Europe/Berlin"},
+            """() => ({
+                language: navigator.language,
+                timezone: Intl.DateTimeFormat().resolvedOptions().timeZone
+            })""",
+            {"language": "de-DE", "timezone": "Europe/Berlin"},
+            id="locale",
+        ),
+    ],
+)
+async def test_context_option(shared_browser, context_kwargs, js_probe, expected):
+    """Test browser context options are applied to pages.
 
     Verifies:
     - Viewport settings are applied to context
-    - Pages in context have correct viewport
-    """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-
-        # Create context with custom viewport
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080}
-        )
-
-        page = await context.new_page()
-
-        # Check viewport size
-        viewport = page.viewport_size
-        assert viewport["width"] == 1920
-        assert viewport["height"] == 1080
-
-        await context.close()
-
-
-@pytest.mark.asyncio
-async def test_context_with_user_agent():
-    """Test browser context with custom user agent.
-
-    Verifies:
     - User agent is applied to context
-    - Pages in context use correct user agent
-    """
-    config = BrowserConfig(headless=True)
-    custom_ua = "Mozilla/5.0 (Custom User Agent) Test/1.0"
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-
-        # Create context with custom user agent
-        context = await browser.new_context(user_agent=custom_ua)
-
-        page = await context.new_page()
-
-        # Evaluate user agent in page
-        page_ua = await page.evaluate("navigator.userAgent")
-        assert page_ua == custom_ua
-
-        await context.close()
-
-
-@pytest.mark.asyncio
-async def test_context_with_locale():
-    """Test browser context with custom locale and timezone.
-
-    Verifies:
-    - Locale settings are applied to context
-    - Timezone settings are applied to context
-    - Pages in context use correct locale and timezone
+    - Locale and timezone settings are applied to context
     """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-
-        # Create context with custom locale and timezone
-        context = await browser.new_context(
-            locale="de-DE",
-            timezone_id="Europe/Berlin",
-        )
-
-        page = await context.new_page()
-
-        # Check locale
-        page_locale = await page.evaluate("navigator.language")
-        assert page_locale == "de-DE"
+    context = await shared_browser.browser.new_context(**context_kwargs)
 
-        # Check timezone (by checking date formatting)
-        # Berlin uses CET/CEST timezone
-        timezone_info = await page.evaluate("""() => {
-            const date = new Date('2024-01-01T12:00:00Z');
-            return {
-                timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
-                offset: date.getTimezoneOffset()
-            };
-        }""")
+    page = await context.new_page()
 
-        assert timezone_info["timezone"] == "Europe/Berlin"
+    # Probe the option from inside the page
+    assert await page.evaluate(js_probe) == expected
 
-        await context.close()
+    await context.close()
 
 
-@pytest.mark.asyncio
-async def test_context_with_geolocation():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_context_with_geolocation(shared_browser):
     """Test browser context with geolocation.
 
     Verifies:
     - Geolocation settings are applied to context
     """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
+    browser = shared_browser.browser
 
-        # Create context with geolocation
-        context = await browser.new_context(
-            geolocation={"latitude": 52.52, "longitude": 13.405},
-            permissions=["geolocation"],
-        )
+    # Create context with geolocation
+    context = await browser.new_context(
+        geolocation={"latitude": 52.52, "longitude": 13.405},
+        permissions=["geolocation"],
+    )
 
-        page = await context.new_page()
-        await page.goto("about:blank")
+    page = await context.new_page()
 
-        # Get geolocation from page
-        location = await page.evaluate("""() => {
-            return new Promise((resolve) => {
-                navigator.geolocation.getCurrentPosition(
-                    (position) => resolve({
-                        latitude: position.coords.latitude,
-                        longitude: position.coords.longitude
-                    }),
-                    (error) => resolve({error: error.message})
-                );
-            });
-        }""")
+    # Get geolocation from page
+    location = await page.evaluate("""() => {
+        return new Promise((resolve) => {
+            navigator.geolocation.getCurrentPosition(
+                (position) => resolve({
+                    latitude: position.coords.latitude,
+                    longitude: position.coords.longitude
+                }),
+                (error) => resolve({error: error.message})
+            );
+        });
+    }""")
 
-        assert "error" not in location
-        assert location["latitude"] == 52.52
-        assert location["longitude"] == 13.405
+    assert "error" not in location
+    assert location["latitude"] == 52.52
+    assert location["longitude"] == 13.405
 
-        await context.close()
+    await context.close()
 
 
-@pytest.mark.asyncio
-async def test_context_with_permissions():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_context_with_permissions(shared_browser):
     """Test browser context with permissions.
 
     Verifies:
     - Permissions can be granted to context
     """
-    config = BrowserConfig(headless=True)
-
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
+    browser = shared_browser.browser
 
-        # Create context with permissions
-        context = await browser.new_context(permissions=["notifications"])
+    # Create context with permissions
+    context = await browser.new_context(permissions=["notifications"])
 
-        page = await context.new_page()
-        await page.goto("about:blank")
+    page = await context.new_page()
 
-        # Check notification permission
-        permission = await page.evaluate(
-            "Notification.permission"
-        )
+    # Check notification permission
+    permission = await page.evaluate(
+        "Notification.permission"
+    )
 
-        assert permission == "granted"
+    assert permission == "granted"
 
-        await context.close()
+    await context.close()
 
 
-@pytest.mark.asyncio
-async def test_multiple_contexts():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_multiple_contexts(shared_browser):
     """Test creating multiple contexts in same browser.
 
     Verifies:
@@ -383,31 +240,28 @@ async def test_multiple_contexts():
     - Each context is independent
     - Contexts can have different settings
     """
-    config = BrowserConfig(headless=True)
+    browser = shared_browser.browser
 
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-
-        # Create two contexts with different viewports
-        context1 = await browser.new_context(
-            viewport={"width": 1920, "height": 1080}
-        )
-        context2 = await browser.new_context(
-            viewport={"width": 1366, "height": 768}
-        )
+    # Create two contexts with different viewports
+    context1 = await browser.new_context(
+        viewport={"width": 1920, "height": 1080}
+    )
+    context2 = await browser.new_context(
+        viewport={"width": 1366, "height": 768}
+    )
 
-        page1 = await context1.new_page()
-        page2 = await context2.new_page()
+    page1 = await context1.new_page()
+    page2 = await context2.new_page()
 
-        # Check viewports are different
-        viewport1 = page1.viewport_size
-        viewport2 = page2.viewport_size
+    # Check viewports are different
+    viewport1 = page1.viewport_size
+    viewport2 = page2.viewport_size
 
-        assert viewport1["width"] == 1920
-        assert viewport2["width"] == 1366
+    assert viewport1["width"] == 1920
+    assert viewport2["width"] == 1366
 
-        await context1.close()
-        await context2.close()
+    await context1.close()
+    await context2.close()
 
 
 # === Browser Configuration Tests ===
@@ -431,25 +285,22 @@ async def test_browser_with_args():
         assert manager.browser.is_connected()
 
 
-@pytest.mark.asyncio
-async def test_browser_headless_mode():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_headless_mode(shared_browser):
     """Test browser in headless mode.
 
     Verifies:
-    - Browser runs in headless mode
-    - Pages can be created and navigated
+    - Shared browser is launched with headless=True
+    - Pages actually run in headless Chromium
     """
-    config = BrowserConfig(headless=True)
+    assert shared_browser.config.headless is True
 
-    async with BrowserManager(browser_type="chromium", config=config) as manager:
-        browser = manager.browser
-        context = await browser.new_context()
-        page = await context.new_page()
+    context = await shared_browser.browser.new_context()
+    page = await context.new_page()
 
-        await page.goto("about:blank")
-        assert page.url == "about:blank"
+    assert "HeadlessChrome" in await page.evaluate("navigator.userAgent")
 
-        await context.close()
+    await context.close()
 
 
 @pytest.mark.asyncio
@@ -4,8 +4,6 @@ Tests for PhantomConfig, ConfigLoader, and ProtectionLevel.
 """
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 import yaml
@@ -23,82 +21,89 @@ from phantom_persona.config import (
     get_level_description,
     get_plugins_for_level,
 )
+from phantom_persona.config import loader
 from phantom_persona.core.exceptions import ConfigNotFoundError, ConfigValidationError
 
 
 # === Fixtures ===
 
 
-@pytest.fixture
-def temp_yaml_file():
-    """Create a temporary YAML file for testing.
+# Complete configuration shared by the sample_config_dict fixture
+SAMPLE_CONFIG = {
+    "level": 2,
+    "browser": {
+        "type": "chromium",
+        "headless": True,
+        "args": ["--no-sandbox"],
+        "slow_mo": 50,
+    },
+    "proxy": {
+        "enabled": True,
+        "source": "proxies.txt",
+        "rotation": "per_session",
+        "validate_proxies": True,
+        "geo_lookup": True,
+    },
+    "fingerprint": {
+        "consistency": "strict",
+        "device_type": "desktop",
+    },
+    "behavior": {
+        "human_delays": True,
+        "delay_range": [0.1, 0.5],
+    },
+    "retry": {
+        "enabled": True,
+        "max_attempts": 5,
+        "backoff": "exponential",
+    },
+}
 
-    Yields:
-        Path to temporary YAML file
-    """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        temp_path = Path(f.name)
 
-    yield temp_path
+@pytest.fixture
+def temp_yaml_file(tmp_path):
+    """Path to a YAML file in the test's temporary directory.
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    Returns:
+        Path to temporary YAML file (not yet created)
+    """
+    return tmp_path / "config.yaml"
 
 
 @pytest.fixture
-def temp_json_file():
-    """Create a temporary JSON file for testing.
+def temp_json_file(tmp_path):
+    """Path to a JSON file in the test's temporary directory.
 
-    Yields:
-        Path to temporary JSON file
+    Returns:
+        Path to temporary JSON file (not yet created)
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        temp_path = Path(f.name)
+    return tmp_path / "config.json"
+
 
-    yield temp_path
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run the test once per JSON parser ConfigLoader can use.
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    Returns:
+        Name of the active backend
+    """
+    if request.param == "orjson":
+        monkeypatch.setattr(loader, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(loader, "orjson", None)
+    return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config_dict():
     """Sample configuration dictionary for testing.
 
+    Shared by all tests in the module; tests must not mutate it.
+
     Returns:
         Dictionary with complete config
     """
-    return {
-        "level": 2,
-        "browser": {
-            "type": "chromium",
-            "headless": True,
-            "args": ["--no-sandbox"],
-            "slow_mo": 50,
-        },
-        "proxy": {
-            "enabled": True,
-            "source": "proxies.txt",
-            "rotation": "per_session",
-            "validate_proxies": True,
-            "geo_lookup": True,
-        },
-        "fingerprint": {
-            "consistency": "strict",
-            "device_type": "desktop",
-        },
-        "behavior": {
-            "human_delays": True,
-            "delay_range": [0.1, 0.5],
-        },
-        "retry": {
-            "enabled": True,
-            "max_attempts": 5,
-            "backoff": "exponential",
-        },
-    }
+    return SAMPLE_CONFIG
 
 
 @pytest.fixture
@@ -209,7 +214,7 @@ def test_config_from_yaml(temp_yaml_file, sample_config_dict):
     """
     # Write sample config to YAML file
     with open(temp_yaml_file, "w") as f:
-        yaml.dump(sample_config_dict, f)
+        yaml.dump(sample_config_dict, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
 
     # Load from file path (as Path)
     config_from_path = ConfigLoader.load(temp_yaml_file)
@@ -227,12 +232,12 @@ def test_config_from_yaml(temp_yaml_file, sample_config_dict):
     assert config_from_path.behavior.delay_range == (0.1, 0.5)
 
 
-def test_config_from_json(temp_json_file, sample_config_dict):
+def test_config_from_json(temp_json_file, sample_config_dict, json_backend):
     """Test loading config from JSON file.
 
     Verifies:
     - ConfigLoader.load() accepts JSON files
-    - JSON is correctly parsed
+    - JSON is correctly parsed with both stdlib json and orjson
     """
     # Write sample config to JSON file
     with open(temp_json_file, "w") as f:
@@ -246,16 +251,54 @@ def test_config_from_json(temp_json_file, sample_config_dict):
     assert config.proxy.enabled is True
 
 
-def test_config_validation_level_valid():
+def test_config_file_cache(temp_json_file, sample_config_dict, monkeypatch):
+    """Test file configs are cached until the file changes.
+
+    Verifies:
+    - Repeated loads of an unchanged file parse it once
+    - Loaded configs are equal but independent copies
+    - Rewriting the file invalidates the cached entry
+    - invalidate_cache() forces a re-parse
+    """
+    parses = []
+    load_json = ConfigLoader.load_json
+
+    def counting_load_json(path):
+        parses.append(path)
+        return load_json(path)
+
+    monkeypatch.setattr(ConfigLoader, "load_json", staticmethod(counting_load_json))
+    ConfigLoader.invalidate_cache()
+    temp_json_file.write_text(json.dumps(sample_config_dict))
+
+    first = ConfigLoader.load(temp_json_file)
+    first.browser.args.append("--mutated")
+    second = ConfigLoader.load(temp_json_file)
+    assert second == ConfigLoader.load(temp_json_file)
+    assert len(parses) == 1
+    assert second is not first
+    assert "--mutated" not in second.browser.args
+
+    # Different size, so the cache key changes even with coarse mtimes
+    temp_json_file.write_text(json.dumps({**sample_config_dict, "level": 3}) + "\n")
+    assert ConfigLoader.load(temp_json_file).level == 3
+    assert len(parses) == 2
+
+    ConfigLoader.invalidate_cache()
+    assert ConfigLoader.load(temp_json_file).level == 3
+    assert len(parses) == 3
+
+
+@pytest.mark.parametrize("level", range(5))
+def test_config_validation_level_valid(level):
     """Test that valid protection levels (0-4) are accepted.
 
     Verifies:
     - Levels 0, 1, 2, 3, 4 are all valid
     - No validation errors raised
     """
-    for level in range(5):
-        config = PhantomConfig(level=level)
-        assert config.level == level
+    config = PhantomConfig(level=level)
+    assert config.level == level
 
 
 def test_config_validation_level_invalid():
@@ -266,14 +309,12 @@ def test_config_validation_level_invalid():
     - Level > 4 raises ValidationError
     """
     # Test level too low
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match=r"(?i)level"):
         PhantomConfig(level=-1)
-    assert "level" in str(exc_info.value).lower()
 
     # Test level too high
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match=r"(?i)level"):
         PhantomConfig(level=5)
-    assert "level" in str(exc_info.value).lower()
 
 
 def test_config_merge_with_defaults(partial_config_dict):
@@ -302,7 +343,8 @@ def test_config_merge_with_defaults(partial_config_dict):
     assert config.retry.max_attempts == 3  # default
 
 
-def test_config_from_level():
+@pytest.mark.parametrize("level", range(5))
+def test_config_from_level(level):
     """Test creating config from protection level.
 
     Verifies:
@@ -310,11 +352,35 @@ def test_config_from_level():
     - Level is set correctly
     - All other settings use defaults
     """
-    for level in range(5):
-        config = ConfigLoader.from_level(level)
-        assert config.level == level
-        assert isinstance(config, PhantomConfig)
-        assert config.browser.type == "chromium"
+    config = ConfigLoader.from_level(level)
+    assert config.level == level
+    assert isinstance(config, PhantomConfig)
+    assert config.browser.type == "chromium"
+    assert config == PhantomConfig(level=level)
+
+
+def test_config_from_level_fresh_sections():
+    """Test from_level() configs don't share state.
+
+    Verifies:
+    - ProtectionLevel members are stored as plain ints
+    - Each config gets its own section models
+    """
+    first = ConfigLoader.from_level(ProtectionLevel.MODERATE)
+    second = ConfigLoader.from_level(ProtectionLevel.MODERATE)
+    assert type(first.level) is int
+    assert first.browser is not second.browser
+
+
+@pytest.mark.parametrize("level", [-1, 5])
+def test_config_from_level_invalid(level):
+    """Test from_level() rejects out-of-range levels.
+
+    Verifies:
+    - Levels outside 0-4 raise ConfigValidationError
+    """
+    with pytest.raises(ConfigValidationError):
+        ConfigLoader.from_level(level)
 
 
 def test_protection_level_enum_values():
@@ -325,22 +391,14 @@ def test_protection_level_enum_values():
     - Values are correct (0-4)
     - Names match expected names
     """
-    # Test enum values
-    assert ProtectionLevel.NONE == 0
-    assert ProtectionLevel.BASIC == 1
-    assert ProtectionLevel.MODERATE == 2
-    assert ProtectionLevel.ADVANCED == 3
-    assert ProtectionLevel.STEALTH == 4
-
-    # Test enum names
-    assert ProtectionLevel.NONE.name == "NONE"
-    assert ProtectionLevel.BASIC.name == "BASIC"
-    assert ProtectionLevel.MODERATE.name == "MODERATE"
-    assert ProtectionLevel.ADVANCED.name == "ADVANCED"
-    assert ProtectionLevel.STEALTH.name == "STEALTH"
-
-    # Test all members exist
-    assert len(ProtectionLevel) == 5
+    # Names and values in definition order; also checks no extra members
+    assert [(level.name, level.value) for level in ProtectionLevel] == [
+        ("NONE", 0),
+        ("BASIC", 1),
+        ("MODERATE", 2),
+        ("ADVANCED", 3),
+        ("STEALTH", 4),
+    ]
 
 
 def test_get_plugins_for_level_basic():
@@ -375,17 +433,17 @@ def test_get_plugins_for_level_all_levels():
     assert len(plugins_none) <= len(plugins_basic)
 
 
-def test_get_level_description():
+@pytest.mark.parametrize("level", list(ProtectionLevel))
+def test_get_level_description(level):
     """Test get_level_description() for all levels.
 
     Verifies:
     - Returns string description for each level
     - Description is non-empty
     """
-    for level in ProtectionLevel:
-        description = get_level_description(level)
-        assert isinstance(description, str)
-        assert len(description) > 0
+    description = get_level_description(level)
+    assert isinstance(description, str)
+    assert len(description) > 0
 
 
 def test_behavior_config_delay_range_validation():
@@ -404,38 +462,36 @@ def test_behavior_config_delay_range_validation():
         BehaviorConfig(delay_range=(0.5, 0.1))
 
 
-def test_browser_config_type():
+def test_browser_config_type_default():
+    """Test BrowserConfig defaults to chromium."""
+    assert BrowserConfig().type == "chromium"
+
+
+@pytest.mark.parametrize("browser_type", ["chromium", "firefox", "webkit"])
+def test_browser_config_type(browser_type):
     """Test BrowserConfig type values.
 
     Verifies:
     - Accepts valid browser types
-    - Default is chromium
     """
-    # Default
-    config = BrowserConfig()
-    assert config.type == "chromium"
+    config = BrowserConfig(type=browser_type)
+    assert config.type == browser_type
+
 
-    # Custom browser types
-    for browser_type in ["chromium", "firefox", "webkit"]:
-        config = BrowserConfig(type=browser_type)
-        assert config.type == browser_type
+def test_proxy_config_rotation_default():
+    """Test ProxyConfig rotation defaults to per_session."""
+    assert ProxyConfig().rotation == "per_session"
 
 
-def test_proxy_config_rotation_values():
+@pytest.mark.parametrize("rotation", ["per_session", "per_request", "manual"])
+def test_proxy_config_rotation_values(rotation):
     """Test ProxyConfig rotation strategy values.
 
     Verifies:
     - Accepts valid rotation strategies
-    - Default is per_session
     """
-    # Default
-    config = ProxyConfig()
-    assert config.rotation == "per_session"
-
-    # Valid values
-    for rotation in ["per_session", "per_request", "manual"]:
-        config = ProxyConfig(rotation=rotation)
-        assert config.rotation == rotation
+    config = ProxyConfig(rotation=rotation)
+    assert config.rotation == rotation
 
 
 def test_config_dict_export():
@@ -450,16 +506,14 @@ def test_config_dict_export():
     config_dict = config.model_dump()
 
     assert isinstance(config_dict, dict)
-    assert "level" in config_dict
-    assert "browser" in config_dict
-    assert "proxy" in config_dict
-    assert "fingerprint" in config_dict
-    assert "behavior" in config_dict
-    assert "retry" in config_dict
+    assert set(config_dict) == set(PhantomConfig.model_fields)
+    assert set(PhantomConfig.model_fields) == {
+        "level", "browser", "proxy", "fingerprint", "behavior", "retry"
+    }
 
     # Check nested dict
     assert isinstance(config_dict["browser"], dict)
-    assert "type" in config_dict["browser"]
+    assert set(config_dict["browser"]) == set(BrowserConfig.model_fields)
 
 
 def test_config_json_serialization():
@@ -520,10 +574,22 @@ def test_config_loader_invalid_yaml(temp_yaml_file):
     # Write invalid YAML
     temp_yaml_file.write_text("invalid: yaml: content: [unclosed")
 
-    with pytest.raises(ConfigValidationError):
+    with pytest.raises(ConfigValidationError, match="Failed to parse YAML file"):
         ConfigLoader.load(temp_yaml_file)
 
 
+def test_config_loader_invalid_json(temp_json_file, json_backend):
+    """Test ConfigLoader with invalid JSON content.
+
+    Verifies:
+    - Raises ConfigValidationError for malformed JSON with either parser
+    """
+    temp_json_file.write_text('{"level": 2,')
+
+    with pytest.raises(ConfigValidationError, match="Failed to parse JSON file"):
+        ConfigLoader.load(temp_json_file)
+
+
 def test_empty_config_dict():
     """Test loading empty config dict uses all defaults.
 
@@ -3,18 +3,36 @@
 Tests for Persona, GeoInfo, DeviceInfo, and Fingerprint dataclasses.
 """
 
-from datetime import datetime
-from time import sleep
+import uuid
+from datetime import datetime, timedelta
 
 import pytest
 
 from phantom_persona.persona import DeviceInfo, Fingerprint, GeoInfo, Persona
 
 
+# Fixed creation time for personas that don't need a wall-clock timestamp
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Top-level keys produced by Persona.to_dict()
+PERSONA_KEYS = frozenset({
+    "id",
+    "fingerprint",
+    "geo",
+    "proxy",
+    "cookies",
+    "local_storage",
+    "created_at",
+    "last_used",
+    "use_count",
+    "is_burned",
+})
+
+
 # === Fixtures ===
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_geo_info():
     """Sample GeoInfo for testing.
 
@@ -31,7 +49,7 @@ def sample_geo_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_device_info():
     """Sample DeviceInfo for testing.
 
@@ -48,7 +66,7 @@ def sample_device_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_fingerprint(sample_device_info):
     """Sample Fingerprint for testing.
 
@@ -65,13 +83,16 @@ def sample_fingerprint(sample_device_info):
 def sample_persona(sample_fingerprint, sample_geo_info):
     """Sample Persona for testing.
 
+    Function-scoped because tests mutate usage state; the fingerprint
+    and geo parts are module-scoped and shared read-only.
+
     Returns:
         Persona instance with all basic fields
     """
     return Persona(
         fingerprint=sample_fingerprint,
         geo=sample_geo_info,
-        created_at=datetime.now(),
+        created_at=_NOW,
     )
 
 
@@ -86,7 +107,7 @@ def test_persona_creation(sample_fingerprint, sample_geo_info):
     - Required fields are set correctly
     - Optional fields have proper defaults
     """
-    created_at = datetime.now()
+    created_at = _NOW
     persona = Persona(
         fingerprint=sample_fingerprint,
         geo=sample_geo_info,
@@ -134,8 +155,8 @@ def test_persona_default_id():
     fingerprint = Fingerprint(user_agent="Mozilla/5.0", device=device)
 
     # Create two personas without specifying ID
-    persona1 = Persona(fingerprint=fingerprint, geo=geo, created_at=datetime.now())
-    persona2 = Persona(fingerprint=fingerprint, geo=geo, created_at=datetime.now())
+    persona1 = Persona(fingerprint=fingerprint, geo=geo, created_at=_NOW)
+    persona2 = Persona(fingerprint=fingerprint, geo=geo, created_at=_NOW)
 
     # Check IDs are generated
     assert persona1.id is not None
@@ -146,41 +167,60 @@ def test_persona_default_id():
     # Check IDs are unique
     assert persona1.id != persona2.id
 
-    # Check ID format (UUID4 has 5 groups separated by dashes)
-    assert len(persona1.id.split("-")) == 5
+    # Check ID format (parses as a version 4 UUID)
+    assert uuid.UUID(persona1.id).version == 4
+    assert uuid.UUID(persona2.id).version == 4
+
+
+def test_persona_from_dict_without_id(sample_persona):
+    """Test Persona.from_dict() generates an ID when none is stored.
+
+    Verifies:
+    - Missing or empty ID gets a freshly generated one
+    - Stored ID is kept as-is
+    """
+    # Stored ID is preserved
+    assert Persona.from_dict(sample_persona.to_dict()).id == sample_persona.id
+
+    # Missing ID is generated
+    persona_dict = sample_persona.to_dict()
+    del persona_dict["id"]
+    restored = Persona.from_dict(persona_dict)
+    assert restored.id
+    assert restored.id != sample_persona.id
 
 
 def test_persona_mark_used(sample_persona):
     """Test Persona.mark_used() updates statistics.
 
     Verifies:
-    - last_used is set to current time
+    - An explicit timestamp is stored as-is
     - use_count is incremented
+    - Without a timestamp, last_used is set to the current time
     - Multiple calls increment use_count correctly
     """
+    used_at = _NOW + timedelta(minutes=5)
+
     # Initial state
     assert sample_persona.last_used is None
     assert sample_persona.use_count == 0
 
     # Mark as used once
-    before = datetime.now()
-    sample_persona.mark_used()
-    after = datetime.now()
+    sample_persona.mark_used(now=used_at)
 
-    assert sample_persona.last_used is not None
-    assert before <= sample_persona.last_used <= after
+    assert sample_persona.last_used == used_at
     assert sample_persona.use_count == 1
 
-    # Mark as used again
-    sleep(0.01)  # Small delay to ensure different timestamp
-    first_use = sample_persona.last_used
-    sample_persona.mark_used()
+    # Mark as used again at an explicit, later time
+    later = sample_persona.last_used + timedelta(seconds=1)
+    sample_persona.mark_used(now=later)
 
-    assert sample_persona.last_used > first_use
+    assert sample_persona.last_used == later
     assert sample_persona.use_count == 2
 
-    # Mark as used third time
+    # Mark as used third time, defaulting to the current time
     sample_persona.mark_used()
+    assert sample_persona.last_used > later
     assert sample_persona.use_count == 3
 
 
@@ -220,22 +260,14 @@ def test_persona_to_dict(sample_persona):
     assert isinstance(persona_dict, dict)
 
     # Check top-level fields
-    assert "id" in persona_dict
-    assert "fingerprint" in persona_dict
-    assert "geo" in persona_dict
-    assert "proxy" in persona_dict
-    assert "cookies" in persona_dict
-    assert "local_storage" in persona_dict
-    assert "created_at" in persona_dict
-    assert "last_used" in persona_dict
-    assert "use_count" in persona_dict
-    assert "is_burned" in persona_dict
+    missing = PERSONA_KEYS - persona_dict.keys()
+    assert not missing, missing
 
     # Check nested structures
     assert isinstance(persona_dict["fingerprint"], dict)
     assert isinstance(persona_dict["geo"], dict)
-    assert "user_agent" in persona_dict["fingerprint"]
-    assert "device" in persona_dict["fingerprint"]
+    missing = {"user_agent", "device"} - persona_dict["fingerprint"].keys()
+    assert not missing, missing
     assert "country" in persona_dict["geo"]
 
     # Check datetime conversion
@@ -243,68 +275,66 @@ def test_persona_to_dict(sample_persona):
     assert "T" in persona_dict["created_at"]  # ISO format has T separator
 
 
-def test_persona_from_dict(sample_persona):
-    """Test Persona.from_dict() deserialization.
+def test_persona_from_dict_does_not_mutate_input(sample_persona):
+    """Test Persona.from_dict() leaves the input dictionary untouched.
 
     Verifies:
-    - Persona can be reconstructed from dict
-    - All fields are restored correctly
-    - Roundtrip (to_dict -> from_dict) preserves data
+    - Nested device data stays a plain dict after deserialization
+    - The same dict can be deserialized more than once
     """
-    # Serialize to dict
     persona_dict = sample_persona.to_dict()
 
-    # Deserialize back to Persona
-    restored_persona = Persona.from_dict(persona_dict)
+    first = Persona.from_dict(persona_dict)
+    assert isinstance(persona_dict["fingerprint"]["device"], dict)
 
-    # Check fields match
-    assert restored_persona.id == sample_persona.id
-    assert restored_persona.fingerprint.user_agent == sample_persona.fingerprint.user_agent
-    assert restored_persona.geo.country == sample_persona.geo.country
-    assert restored_persona.geo.city == sample_persona.geo.city
-    assert restored_persona.use_count == sample_persona.use_count
-    assert restored_persona.is_burned == sample_persona.is_burned
+    second = Persona.from_dict(persona_dict)
+    assert first == second
 
-    # Check datetime fields
-    assert restored_persona.created_at == sample_persona.created_at
-    assert restored_persona.last_used == sample_persona.last_used
 
+def _make_basic():
+    """Persona with only required fields."""
+    device = DeviceInfo(
+        type="desktop",
+        platform="Win32",
+        vendor="Google Inc.",
+        renderer="ANGLE (Intel, Mesa Intel(R) UHD Graphics 620)",
+        screen_width=1920,
+        screen_height=1080,
+    )
+    return Persona(
+        fingerprint=Fingerprint(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            device=device,
+        ),
+        geo=GeoInfo(
+            country_code="US",
+            country="United States",
+            city="New York",
+            timezone="America/New_York",
+            language="en-US",
+            languages=["en-US", "en"],
+        ),
+        created_at=_NOW,
+    )
 
-def test_persona_roundtrip_with_usage(sample_persona):
-    """Test Persona roundtrip after marking as used.
-
-    Verifies:
-    - Persona with usage stats can be serialized and restored
-    - Usage statistics are preserved
-    """
-    # Mark as used
-    sample_persona.mark_used()
-    sample_persona.mark_used()
 
-    # Roundtrip
-    persona_dict = sample_persona.to_dict()
-    restored = Persona.from_dict(persona_dict)
+def _make_with_usage():
+    """Persona with usage statistics."""
+    persona = _make_basic()
+    persona.mark_used()
+    persona.mark_used()
+    return persona
 
-    # Verify usage stats preserved
-    assert restored.use_count == 2
-    assert restored.last_used is not None
-    assert restored.last_used == sample_persona.last_used
 
+def _make_burned():
+    """Persona that has been used and burned."""
+    persona = _make_with_usage()
+    persona.burn()
+    return persona
 
-def test_persona_roundtrip_with_cookies():
-    """Test Persona roundtrip with cookies and local storage.
 
-    Verifies:
-    - Cookies and localStorage are preserved
-    """
-    geo = GeoInfo(
-        country_code="DE",
-        country="Germany",
-        city="Berlin",
-        timezone="Europe/Berlin",
-        language="de-DE",
-        languages=["de-DE", "de", "en"],
-    )
+def _make_with_cookies():
+    """Persona with cookies and local storage."""
     device = DeviceInfo(
         type="desktop",
         platform="Linux x86_64",
@@ -313,356 +343,298 @@ def test_persona_roundtrip_with_cookies():
         screen_width=1920,
         screen_height=1080,
     )
-    fingerprint = Fingerprint(user_agent="Mozilla/5.0", device=device)
-
-    persona = Persona(
-        fingerprint=fingerprint,
-        geo=geo,
-        created_at=datetime.now(),
+    return Persona(
+        fingerprint=Fingerprint(user_agent="Mozilla/5.0", device=device),
+        geo=GeoInfo(
+            country_code="DE",
+            country="Germany",
+            city="Berlin",
+            timezone="Europe/Berlin",
+            language="de-DE",
+            languages=["de-DE", "de", "en"],
+        ),
+        created_at=_NOW,
         cookies={"session": "abc123", "tracking": "xyz789"},
         local_storage={"theme": "dark", "lang": "de"},
     )
 
-    # Roundtrip
-    persona_dict = persona.to_dict()
-    restored = Persona.from_dict(persona_dict)
 
-    assert restored.cookies == {"session": "abc123", "tracking": "xyz789"}
-    assert restored.local_storage == {"theme": "dark", "lang": "de"}
-
-
-# === GeoInfo Tests ===
-
-
-def test_geo_info_creation():
-    """Test GeoInfo creation with all fields.
-
-    Verifies:
-    - GeoInfo can be created with all required fields
-    - All fields are set correctly
-    - Optional city field works
-    """
-    geo = GeoInfo(
-        country_code="GB",
-        country="United Kingdom",
-        city="London",
-        timezone="Europe/London",
-        language="en-GB",
-        languages=["en-GB", "en"],
-    )
-
-    assert geo.country_code == "GB"
-    assert geo.country == "United Kingdom"
-    assert geo.city == "London"
-    assert geo.timezone == "Europe/London"
-    assert geo.language == "en-GB"
-    assert geo.languages == ["en-GB", "en"]
-
-
-def test_geo_info_without_city():
-    """Test GeoInfo with None city.
-
-    Verifies:
-    - City is optional and can be None
-    """
-    geo = GeoInfo(
-        country_code="FR",
-        country="France",
-        city=None,
-        timezone="Europe/Paris",
-        language="fr-FR",
-        languages=["fr-FR", "fr"],
-    )
-
-    assert geo.city is None
-    assert geo.country == "France"
-
-
-def test_geo_info_multiple_languages():
-    """Test GeoInfo with multiple language preferences.
-
-    Verifies:
-    - languages list can contain multiple entries
-    - Order is preserved
-    """
-    geo = GeoInfo(
-        country_code="CH",
-        country="Switzerland",
-        city="Zurich",
-        timezone="Europe/Zurich",
-        language="de-CH",
-        languages=["de-CH", "fr-CH", "it-CH", "en"],
-    )
-
-    assert len(geo.languages) == 4
-    assert geo.languages[0] == "de-CH"
-    assert geo.languages[-1] == "en"
-
-
-# === DeviceInfo Tests ===
-
-
-def test_device_info_defaults():
-    """Test DeviceInfo default values.
-
-    Verifies:
-    - color_depth defaults to 24
-    - pixel_ratio defaults to 1.0
-    - Other fields are set correctly
-    """
+def _make_complete():
+    """Persona with every optional field populated and used twice."""
     device = DeviceInfo(
         type="desktop",
-        platform="MacIntel",
-        vendor="Apple Inc.",
-        renderer="Apple M1",
-        screen_width=2560,
-        screen_height=1440,
-    )
-
-    # Check required fields
-    assert device.type == "desktop"
-    assert device.platform == "MacIntel"
-    assert device.vendor == "Apple Inc."
-    assert device.renderer == "Apple M1"
-    assert device.screen_width == 2560
-    assert device.screen_height == 1440
-
-    # Check defaults
-    assert device.color_depth == 24
-    assert device.pixel_ratio == 1.0
-
-
-def test_device_info_custom_defaults():
-    """Test DeviceInfo with custom color_depth and pixel_ratio.
-
-    Verifies:
-    - Defaults can be overridden
-    """
-    device = DeviceInfo(
-        type="mobile",
-        platform="iPhone",
-        vendor="Apple Inc.",
-        renderer="Apple GPU",
-        screen_width=390,
-        screen_height=844,
-        color_depth=32,
-        pixel_ratio=3.0,
+        platform="Win32",
+        vendor="NVIDIA Corporation",
+        renderer="NVIDIA GeForce RTX 3080",
+        screen_width=3840,
+        screen_height=2160,
+        pixel_ratio=1.5,
     )
-
-    assert device.color_depth == 32
-    assert device.pixel_ratio == 3.0
-
-
-def test_device_info_mobile_type():
-    """Test DeviceInfo with mobile type.
-
-    Verifies:
-    - type can be "mobile"
-    - Mobile-specific configurations work
-    """
-    device = DeviceInfo(
-        type="mobile",
-        platform="Linux armv8l",
-        vendor="Qualcomm",
-        renderer="Adreno",
-        screen_width=1080,
-        screen_height=2400,
-        pixel_ratio=2.625,
+    persona = Persona(
+        fingerprint=Fingerprint(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            device=device,
+            canvas_hash="jp_canvas_hash",
+            webgl_hash="jp_webgl_hash",
+            fonts=["MS Gothic", "Yu Gothic", "Meiryo"],
+        ),
+        geo=GeoInfo(
+            country_code="JP",
+            country="Japan",
+            city="Tokyo",
+            timezone="Asia/Tokyo",
+            language="ja-JP",
+            languages=["ja-JP", "ja", "en"],
+        ),
+        created_at=_NOW,
+        cookies={"sid": "session123"},
+        local_storage={"pref": "dark"},
     )
-
-    assert device.type == "mobile"
-    assert device.screen_width == 1080
-    assert device.pixel_ratio == 2.625
+    persona.mark_used()
+    persona.mark_used()
+    return persona
 
 
-# === Fingerprint Tests ===
+ROUNDTRIP_CASES = [
+    pytest.param(_make_basic, id="basic"),
+    pytest.param(_make_with_usage, id="used"),
+    pytest.param(_make_burned, id="burned"),
+    pytest.param(_make_with_cookies, id="cookies"),
+    pytest.param(_make_complete, id="complete"),
+]
 
 
-def test_fingerprint_optional_fields():
-    """Test Fingerprint optional fields default to None.
+@pytest.mark.parametrize("factory", ROUNDTRIP_CASES)
+def test_persona_roundtrip(factory):
+    """Test Persona.to_dict() -> Persona.from_dict() roundtrip.
 
     Verifies:
-    - canvas_hash defaults to None
-    - webgl_hash defaults to None
-    - audio_hash defaults to None
-    - fonts defaults to empty list
-    """
-    device = DeviceInfo(
-        type="desktop",
-        platform="Win32",
-        vendor="NVIDIA",
-        renderer="GeForce GTX",
-        screen_width=1920,
-        screen_height=1080,
-    )
-
-    fingerprint = Fingerprint(
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-        device=device,
-    )
+    - Every field is restored, including nested dataclasses
+    - Datetimes, usage statistics, burned state, cookies and localStorage
+      are preserved
 
-    # Check optional fields
-    assert fingerprint.canvas_hash is None
-    assert fingerprint.webgl_hash is None
-    assert fingerprint.audio_hash is None
-    assert fingerprint.fonts == []
-
-
-def test_fingerprint_with_hashes():
-    """Test Fingerprint with all hash fields set.
-
-    Verifies:
-    - Hash fields can be set
-    - All values are stored correctly
+    Args:
+        factory: Zero-argument callable building the persona to roundtrip
     """
-    device = DeviceInfo(
-        type="desktop",
-        platform="Win32",
-        vendor="AMD",
-        renderer="Radeon",
-        screen_width=1920,
-        screen_height=1080,
-    )
-
-    fingerprint = Fingerprint(
-        user_agent="Mozilla/5.0",
-        device=device,
-        canvas_hash="abc123def456",
-        webgl_hash="ghi789jkl012",
-        audio_hash="mno345pqr678",
-    )
-
-    assert fingerprint.canvas_hash == "abc123def456"
-    assert fingerprint.webgl_hash == "ghi789jkl012"
-    assert fingerprint.audio_hash == "mno345pqr678"
-
+    persona = factory()
 
-def test_fingerprint_with_fonts():
-    """Test Fingerprint with fonts list.
-
-    Verifies:
-    - fonts list can be populated
-    - Multiple fonts are stored
-    """
-    device = DeviceInfo(
-        type="desktop",
-        platform="Win32",
-        vendor="Intel",
-        renderer="Intel HD",
-        screen_width=1366,
-        screen_height=768,
-    )
+    assert Persona.from_dict(persona.to_dict()) == persona
 
-    fonts = ["Arial", "Times New Roman", "Courier New", "Verdana", "Georgia"]
-    fingerprint = Fingerprint(
-        user_agent="Mozilla/5.0",
-        device=device,
-        fonts=fonts,
-    )
 
-    assert len(fingerprint.fonts) == 5
-    assert "Arial" in fingerprint.fonts
-    assert "Georgia" in fingerprint.fonts
+# === GeoInfo Tests ===
 
 
-def test_fingerprint_complete():
-    """Test Fingerprint with all fields populated.
+GEO_CASES = [
+    pytest.param(
+        dict(
+            country_code="GB",
+            country="United Kingdom",
+            city="London",
+            timezone="Europe/London",
+            language="en-GB",
+            languages=["en-GB", "en"],
+        ),
+        id="all-fields",
+    ),
+    pytest.param(
+        dict(
+            country_code="FR",
+            country="France",
+            city=None,
+            timezone="Europe/Paris",
+            language="fr-FR",
+            languages=["fr-FR", "fr"],
+        ),
+        id="without-city",
+    ),
+    pytest.param(
+        dict(
+            country_code="CH",
+            country="Switzerland",
+            city="Zurich",
+            timezone="Europe/Zurich",
+            language="de-CH",
+            languages=["de-CH", "fr-CH", "it-CH", "en"],
+        ),
+        id="multiple-languages",
+    ),
+]
+
+
+@pytest.mark.parametrize("kwargs", GEO_CASES)
+def test_geo_info(kwargs):
+    """Test GeoInfo creation.
 
     Verifies:
-    - Complete fingerprint can be created
     - All fields are set correctly
-    """
-    device = DeviceInfo(
-        type="desktop",
-        platform="MacIntel",
-        vendor="Apple Inc.",
-        renderer="Apple M2",
-        screen_width=2880,
-        screen_height=1800,
-        color_depth=24,
-        pixel_ratio=2.0,
-    )
+    - City is optional and can be None
+    - Language order is preserved
 
-    fingerprint = Fingerprint(
-        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
-        device=device,
-        canvas_hash="canvas_abc123",
-        webgl_hash="webgl_def456",
-        audio_hash="audio_ghi789",
-        fonts=["SF Pro", "Helvetica Neue", "Arial"],
-    )
+    Args:
+        kwargs: Constructor arguments
+    """
+    geo = GeoInfo(**kwargs)
 
-    assert fingerprint.user_agent.startswith("Mozilla/5.0")
-    assert fingerprint.device.type == "desktop"
-    assert fingerprint.canvas_hash == "canvas_abc123"
-    assert fingerprint.webgl_hash == "webgl_def456"
-    assert fingerprint.audio_hash == "audio_ghi789"
-    assert len(fingerprint.fonts) == 3
+    for name, value in kwargs.items():
+        assert getattr(geo, name) == value, name
 
 
-# === Integration Tests ===
+# === DeviceInfo Tests ===
 
 
-def test_complete_persona_workflow():
-    """Test complete workflow: create, use, serialize, restore.
+DEVICE_CASES = [
+    pytest.param(
+        dict(
+            type="desktop",
+            platform="MacIntel",
+            vendor="Apple Inc.",
+            renderer="Apple M1",
+            screen_width=2560,
+            screen_height=1440,
+        ),
+        {"color_depth": 24, "pixel_ratio": 1.0},
+        id="defaults",
+    ),
+    pytest.param(
+        dict(
+            type="mobile",
+            platform="iPhone",
+            vendor="Apple Inc.",
+            renderer="Apple GPU",
+            screen_width=390,
+            screen_height=844,
+            color_depth=32,
+            pixel_ratio=3.0,
+        ),
+        {},
+        id="custom-defaults",
+    ),
+    pytest.param(
+        dict(
+            type="mobile",
+            platform="Linux armv8l",
+            vendor="Qualcomm",
+            renderer="Adreno",
+            screen_width=1080,
+            screen_height=2400,
+            pixel_ratio=2.625,
+        ),
+        {"color_depth": 24},
+        id="mobile",
+    ),
+]
+
+
+@pytest.mark.parametrize("kwargs, expected", DEVICE_CASES)
+def test_device_info(kwargs, expected):
+    """Test DeviceInfo creation.
 
     Verifies:
-    - Complete persona lifecycle works
-    - All operations preserve data correctly
+    - color_depth defaults to 24 and pixel_ratio to 1.0
+    - Defaults can be overridden
+    - type can be "mobile"
+
+    Args:
+        kwargs: Constructor arguments
+        expected: Expected values for fields not passed in kwargs
     """
-    # Create complete persona
-    geo = GeoInfo(
-        country_code="JP",
-        country="Japan",
-        city="Tokyo",
-        timezone="Asia/Tokyo",
-        language="ja-JP",
-        languages=["ja-JP", "ja", "en"],
-    )
+    device = DeviceInfo(**kwargs)
 
-    device = DeviceInfo(
-        type="desktop",
-        platform="Win32",
-        vendor="NVIDIA Corporation",
-        renderer="NVIDIA GeForce RTX 3080",
-        screen_width=3840,
-        screen_height=2160,
-        pixel_ratio=1.5,
-    )
+    for name, value in {**kwargs, **expected}.items():
+        assert getattr(device, name) == value, name
 
-    fingerprint = Fingerprint(
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-        device=device,
-        canvas_hash="jp_canvas_hash",
-        webgl_hash="jp_webgl_hash",
-        fonts=["MS Gothic", "Yu Gothic", "Meiryo"],
-    )
 
-    persona = Persona(
-        fingerprint=fingerprint,
-        geo=geo,
-        created_at=datetime.now(),
-        cookies={"sid": "session123"},
-        local_storage={"pref": "dark"},
-    )
+# === Fingerprint Tests ===
 
-    # Use persona
-    persona.mark_used()
-    persona.mark_used()
 
-    # Serialize
-    data = persona.to_dict()
+FINGERPRINT_CASES = [
+    pytest.param(
+        dict(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            device=DeviceInfo(
+                type="desktop",
+                platform="Win32",
+                vendor="NVIDIA",
+                renderer="GeForce GTX",
+                screen_width=1920,
+                screen_height=1080,
+            ),
+        ),
+        {"canvas_hash": None, "webgl_hash": None, "audio_hash": None, "fonts": []},
+        id="optional-fields",
+    ),
+    pytest.param(
+        dict(
+            user_agent="Mozilla/5.0",
+            device=DeviceInfo(
+                type="desktop",
+                platform="Win32",
+                vendor="AMD",
+                renderer="Radeon",
+                screen_width=1920,
+                screen_height=1080,
+            ),
+            canvas_hash="abc123def456",
+            webgl_hash="ghi789jkl012",
+            audio_hash="mno345pqr678",
+        ),
+        {"fonts": []},
+        id="with-hashes",
+    ),
+    pytest.param(
+        dict(
+            user_agent="Mozilla/5.0",
+            device=DeviceInfo(
+                type="desktop",
+                platform="Win32",
+                vendor="Intel",
+                renderer="Intel HD",
+                screen_width=1366,
+                screen_height=768,
+            ),
+            fonts=["Arial", "Times New Roman", "Courier New", "Verdana", "Georgia"],
+        ),
+        {"canvas_hash": None},
+        id="with-fonts",
+    ),
+    pytest.param(
+        dict(
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+            device=DeviceInfo(
+                type="desktop",
+                platform="MacIntel",
+                vendor="Apple Inc.",
+                renderer="Apple M2",
+                screen_width=2880,
+                screen_height=1800,
+                color_depth=24,
+                pixel_ratio=2.0,
+            ),
+            canvas_hash="canvas_abc123",
+            webgl_hash="webgl_def456",
+            audio_hash="audio_ghi789",
+            fonts=["SF Pro", "Helvetica Neue", "Arial"],
+        ),
+        {},
+        id="complete",
+    ),
+]
+
+
+@pytest.mark.parametrize("kwargs, expected", FINGERPRINT_CASES)
+def test_fingerprint(kwargs, expected):
+    """Test Fingerprint creation.
 
-    # Restore
-    restored = Persona.from_dict(data)
+    Verifies:
+    - Hash fields default to None and fonts to an empty list
+    - Hash fields and fonts can be set
+    - Complete fingerprint keeps every field
 
-    # Verify
-    assert restored.geo.country == "Japan"
-    assert restored.use_count == 2
-    assert restored.cookies == {"sid": "session123"}
-    assert restored.fingerprint.fonts == ["MS Gothic", "Yu Gothic", "Meiryo"]
-    assert restored.is_burned is False
+    Args:
+        kwargs: Constructor arguments
+        expected: Expected values for fields not passed in kwargs
+    """
+    fingerprint = Fingerprint(**kwargs)
 
-    # Burn and verify
-    restored.burn()
-    assert restored.is_burned is True
+    for name, value in {**kwargs, **expected}.items():
+        assert getattr(fingerprint, name) == value, name
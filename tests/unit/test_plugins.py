@@ -0,0 +1,135 @@
+"""Unit tests for plugin module.
+
+Tests for Plugin base classes and PluginRegistry.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from phantom_persona.config import ProtectionLevel
+from phantom_persona.plugins import FingerprintPlugin, StealthPlugin, registry
+from phantom_persona.stealth.plugins import basic
+
+
+# === Fixtures ===
+
+
+@pytest.fixture
+def isolated_registry():
+    """Snapshot the global registry and restore it after the test.
+
+    Yields:
+        The global PluginRegistry instance
+    """
+    saved = dict(registry._plugins)
+    yield registry
+    registry._plugins.clear()
+    registry._plugins.update(saved)
+
+
+class ChromeOnlyPlugin(StealthPlugin):
+    """Test plugin restricted to Chromium."""
+
+    name = "stealth.chrome"
+    priority = 20
+    compatible_browsers = frozenset({"chromium"})
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+
+    async def apply(self, context):
+        pass
+
+
+class AnyBrowserPlugin(FingerprintPlugin):
+    """Test plugin compatible with all browsers."""
+
+    name = "fingerprint.canvas"
+    priority = 5
+
+    async def apply(self, context):
+        pass
+
+
+# === Tests ===
+
+
+def test_plugin_compatible_with_all_browsers_by_default():
+    """Test default browser compatibility.
+
+    Verifies:
+    - compatible_browsers defaults to None
+    - Plugin is compatible with every browser type
+    """
+    plugin = AnyBrowserPlugin()
+
+    assert AnyBrowserPlugin.compatible_browsers is None
+    for browser_type in ["chromium", "firefox", "webkit"]:
+        assert plugin.is_compatible(browser_type)
+
+
+def test_plugin_compatible_browsers_restriction():
+    """Test compatible_browsers restricts is_compatible().
+
+    Verifies:
+    - Listed browser types are compatible
+    - Other browser types are not
+    """
+    plugin = ChromeOnlyPlugin()
+
+    assert plugin.is_compatible("chromium")
+    assert not plugin.is_compatible("firefox")
+    assert not plugin.is_compatible("webkit")
+
+
+def test_get_for_level_filters_and_sorts(isolated_registry):
+    """Test get_for_level() filters by browser and sorts by priority.
+
+    Verifies:
+    - Incompatible plugins are skipped without being instantiated
+    - Compatible plugins are returned sorted by priority
+    """
+    isolated_registry.register(ChromeOnlyPlugin)
+    isolated_registry.register(AnyBrowserPlugin)
+    ChromeOnlyPlugin.instances = 0
+
+    firefox_plugins = isolated_registry.get_for_level(
+        ProtectionLevel.MODERATE, browser_type="firefox"
+    )
+    assert not any(isinstance(p, ChromeOnlyPlugin) for p in firefox_plugins)
+    assert ChromeOnlyPlugin.instances == 0
+
+    chromium_plugins = isolated_registry.get_for_level(
+        ProtectionLevel.MODERATE, browser_type="chromium"
+    )
+    names = [p.name for p in chromium_plugins]
+    assert "stealth.chrome" in names
+    assert "fingerprint.canvas" in names
+    assert [p.priority for p in chromium_plugins] == sorted(
+        p.priority for p in chromium_plugins
+    )
+
+
+async def test_basic_stealth_plugin_single_init_script():
+    """Test BasicStealthPlugin installs all patches in one init script.
+
+    Verifies:
+    - add_init_script() is awaited exactly once
+    - Every patch is included, each wrapped in its own try block
+    """
+    context = AsyncMock()
+
+    await basic.BasicStealthPlugin().apply(context)
+
+    context.add_init_script.assert_awaited_once()
+    (script,), _ = context.add_init_script.await_args
+    patches = [
+        value
+        for name, value in vars(basic).items()
+        if name.startswith("_") and name.endswith("_PATCH")
+    ]
+    assert len(patches) == 5
+    for patch in patches:
+        assert f"try {{{patch}}} catch (e) {{}}" in script